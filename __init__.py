@@ -4,14 +4,22 @@ Combat information overload and decision fatigue with AI-powered intelligent fil
 synthesis, and decision support.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Nilesh Vikky"
 __email__ = "vikky.sarswat@gmail.com"
 
 from .config import load_config, InfoFlowConfig
 from .models import ContentItem, FilterCriteria, FilteredResult
-from .storage import StorageManager
-from .filters import ContentFilter, DuplicateDetector
+
+# Heavier components (NumPy, storage backends, ...) are imported on first access
+_LAZY_IMPORTS = {
+    "StorageManager": ".storage",
+    "ContentFilter": ".filters",
+    "DuplicateDetector": ".filters",
+    "UrgencyBoard": ".filters",
+}
 
 __all__ = [
     "load_config",
@@ -22,4 +30,14 @@ __all__ = [
     "StorageManager",
     "ContentFilter",
     "DuplicateDetector",
+    "UrgencyBoard",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
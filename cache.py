@@ -0,0 +1,136 @@
+"""
+Persistent result cache for InfoFlow MCP Server.
+Memoizes expensive scorer/analysis helpers in SQLite, keyed per function namespace.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+from loguru import logger
+
+# Distinguishes a miss from a cached None
+_MISSING = object()
+
+
+def make_key(*parts: Any) -> str:
+    """Stable cache key for a tuple of JSON-serializable arguments."""
+    payload = json.dumps(parts, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class ScorerCache:
+    """
+    SQLite-backed key/value cache for scorer results.
+
+    Values must be JSON-serializable (the helpers it wraps return strings and
+    lists of strings). Passing ``path=None`` (the default) disables caching;
+    wrapped functions are then called straight through.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scorer_cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            ''')
+            conn.commit()
+            self._conn = conn
+            logger.info(f"Scorer cache initialized at {self.path}")
+        return self._conn
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Fetch a cached value.
+
+        Args:
+            namespace: Cache namespace (usually the wrapped function's name)
+            key: Key to look up
+            default: Returned when the key is not cached
+
+        Returns:
+            The cached value, or ``default`` on a miss
+        """
+        if not self.enabled:
+            return default
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT value FROM scorer_cache WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+        except Exception as e:
+            logger.warning(f"Scorer cache read failed: {e}")
+            return default
+        return json.loads(row[0]) if row else default
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value under ``key``, replacing any previous one."""
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO scorer_cache (namespace, key, value) VALUES (?, ?, ?)",
+                    (namespace, key, json.dumps(value))
+                )
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Scorer cache write failed: {e}")
+
+    def cached(self, key: Callable[..., str], version: str) -> Callable:
+        """
+        Decorator memoizing an async function under ``key(*args, **kwargs)``.
+
+        SQLite reads and writes run in a worker thread, so concurrent callers
+        on the event loop are not serialized behind the database.
+
+        Args:
+            key: Builds the cache key from the wrapped function's arguments
+            version: Implementation version, part of the namespace; bump it
+                whenever the wrapped function's output changes so stale
+                entries are never served
+        """
+        def decorator(func):
+            namespace = f"{func.__qualname__}@{version}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+
+                cache_key = key(*args, **kwargs)
+                hit = await asyncio.to_thread(self.get, namespace, cache_key, _MISSING)
+                if hit is not _MISSING:
+                    return hit
+
+                result = await func(*args, **kwargs)
+                await asyncio.to_thread(self.set, namespace, cache_key, result)
+                return result
+
+            return wrapper
+
+        return decorator
@@ -5,27 +5,97 @@ Handles loading and validating configuration from files and environment variable
 
 import os
 import json
+import hashlib
+import functools
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Type
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from loguru import logger
 
+# Package-relative when imported as part of the package; flat when run as a script
+if __package__:
+    from .models import invalidate_cached
+else:
+    from models import invalidate_cached
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Files above this size are streamed instead of parsed in one go
+_JSON_STREAM_THRESHOLD = 64 * 1024
+
+# Pick the YAML loader once: libyaml's C loader when PyYAML was built with it
+try:
+    import yaml
+    _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+except ImportError:
+    yaml = None
+    _YAML_LOADER = None
+
+# Environment variables don't change after process start; read once at import
+_ENV_CONFIG_PATH = os.getenv('CONFIG_PATH')
+
+
+# Values cached on a FilterConfig, by the field they are derived from
+_FILTER_CONFIG_DERIVED = {
+    "blocked_sources": ("blocked_set",),
+    "preferred_sources": ("preferred_set",),
+    "keywords": ("keywords_set",),
+}
+
 
 class FilterConfig(BaseModel):
     """Configuration for content filtering."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     relevance_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
     quality_threshold: float = Field(default=0.6, ge=0.0, le=1.0)
     max_age_days: int = Field(default=30, ge=1)
     preferred_sources: List[str] = Field(default_factory=list)
     blocked_sources: List[str] = Field(default_factory=list)
     keywords: List[str] = Field(default_factory=list)
+    
+    @functools.cached_property
+    def blocked_set(self) -> FrozenSet[str]:
+        """Blocked sources as a frozenset, built once per instance."""
+        return frozenset(self.blocked_sources)
+    
+    @functools.cached_property
+    def preferred_set(self) -> FrozenSet[str]:
+        """Preferred sources as a frozenset, built once per instance."""
+        return frozenset(self.preferred_sources)
+    
+    @functools.cached_property
+    def keywords_set(self) -> FrozenSet[str]:
+        """Lowercased keywords as a frozenset, built once per instance."""
+        return frozenset(kw.lower() for kw in self.keywords if kw)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "FilterConfig":
+        """Copy the config, dropping cached sets derived from any updated field."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            invalidate_cached(copied, update, _FILTER_CONFIG_DERIVED)
+        return copied
 
 
 class SynthesisConfig(BaseModel):
     """Configuration for content synthesis."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     max_summary_length: int = Field(default=500, ge=100)
     extract_key_points: bool = Field(default=True)
     include_sources: bool = Field(default=True)
@@ -36,6 +106,8 @@ class SynthesisConfig(BaseModel):
 class DecisionConfig(BaseModel):
     """Configuration for decision support."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     include_pros_cons: bool = Field(default=True)
     include_recommendations: bool = Field(default=True)
     risk_analysis: bool = Field(default=True)
@@ -46,6 +118,8 @@ class DecisionConfig(BaseModel):
 class CollectorConfig(BaseModel):
     """Configuration for data collectors."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     rss_feeds: List[str] = Field(default_factory=list)
     news_apis: List[str] = Field(default_factory=list)
     social_platforms: List[str] = Field(default_factory=list)
@@ -56,10 +130,13 @@ class CollectorConfig(BaseModel):
 class StorageConfig(BaseModel):
     """Configuration for data storage."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     type: str = Field(default="chromadb")  # chromadb, redis, sqlite
     path: Optional[str] = Field(default="./data/storage")
     redis_url: Optional[str] = Field(default=None)
     sqlite_path: Optional[str] = Field(default="./data/infoflow.db")
+    scorer_cache_path: Optional[str] = Field(default=None)  # e.g. ./data/scorer_cache.db; None disables caching
     max_items: int = Field(default=10000, ge=100)
     retention_days: int = Field(default=90, ge=1)
 
@@ -67,6 +144,8 @@ class StorageConfig(BaseModel):
 class UserPreferences(BaseModel):
     """User-specific preferences."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     topics_of_interest: List[str] = Field(default_factory=list)
     preferred_content_types: List[str] = Field(default=["article", "news", "video"])
     notification_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
@@ -85,6 +164,8 @@ class UserPreferences(BaseModel):
 class APIConfig(BaseModel):
     """API configuration for external services."""
     
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+    
     openai_api_key: Optional[str] = Field(default=None)
     anthropic_api_key: Optional[str] = Field(default=None)
     news_api_key: Optional[str] = Field(default=None)
@@ -95,11 +176,21 @@ class APIConfig(BaseModel):
 class InfoFlowConfig(BaseSettings):
     """Main configuration for InfoFlow MCP Server."""
     
+    model_config = SettingsConfigDict(
+        frozen=True,
+        extra='ignore',
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+        case_sensitive=False
+    )
+    
     # Server Settings
     server_name: str = Field(default="InfoFlow MCP Server")
     version: str = Field(default="1.0.0")
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
+    cpu_workers: int = Field(default=4, ge=1)  # Threads for CPU-bound filtering/dedup work
     
     # Module Configurations
     filter: FilterConfig = Field(default_factory=FilterConfig)
@@ -110,33 +201,61 @@ class InfoFlowConfig(BaseSettings):
     user: UserPreferences = Field(default_factory=UserPreferences)
     api: APIConfig = Field(default_factory=APIConfig)
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        env_nested_delimiter = "__"
-        case_sensitive = False
-    
     @classmethod
     def from_json_file(cls, file_path: str) -> "InfoFlowConfig":
         """Load configuration from a JSON file."""
         try:
-            with open(file_path, 'r') as f:
-                config_dict = json.load(f)
+            config_dict = _read_json_config(file_path, cls.model_fields.keys())
             return cls(**config_dict)
         except FileNotFoundError:
             logger.warning(f"Config file not found: {file_path}. Using defaults.")
             return cls()
+        except _JSON_ERRORS as e:
+            logger.error(f"Invalid JSON in config file: {e}")
+            raise
+    
+    @classmethod
+    def from_json_file_unchecked(cls, file_path: str) -> "InfoFlowConfig":
+        """
+        Load configuration from a JSON file, skipping validation for known-good files.
+        
+        A sidecar ``<file>.validated`` marker records the sha256 of the contents
+        that last passed full validation. When the file still matches, the models
+        are built with ``model_construct``; otherwise the file is validated as usual
+        and the marker is refreshed.
+        """
+        try:
+            raw = Path(file_path).read_bytes()
+            config_dict = _loads_json(raw)
+        except FileNotFoundError:
+            logger.warning(f"Config file not found: {file_path}. Using defaults.")
+            return cls()
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}")
             raise
+        
+        digest = hashlib.sha256(raw).hexdigest()
+        marker = Path(f"{file_path}.validated")
+        if marker.is_file() and marker.read_text().strip() == digest:
+            logger.debug(f"Config unchanged since last validation: {file_path}")
+            return _construct(cls, config_dict)
+        
+        config = cls(**config_dict)
+        try:
+            marker.write_text(digest)
+        except OSError as e:
+            logger.warning(f"Could not write validation marker {marker}: {e}")
+        return config
     
     @classmethod
     def from_yaml_file(cls, file_path: str) -> "InfoFlowConfig":
         """Load configuration from a YAML file."""
+        if _YAML_LOADER is None:
+            raise ImportError("YAML config files require PyYAML. Install with: pip install pyyaml")
+        
         try:
-            import yaml
-            with open(file_path, 'r') as f:
-                config_dict = yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                config_dict = yaml.load(f, Loader=_YAML_LOADER)
             return cls(**config_dict)
         except FileNotFoundError:
             logger.warning(f"Config file not found: {file_path}. Using defaults.")
@@ -152,8 +271,7 @@ class InfoFlowConfig(BaseSettings):
     def save_to_json(self, file_path: str) -> None:
         """Save configuration to a JSON file."""
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        Path(file_path).write_bytes(_dumps_json(self.to_dict()))
         logger.info(f"Configuration saved to {file_path}")
     
     def validate_api_keys(self) -> Dict[str, bool]:
@@ -175,6 +293,81 @@ class InfoFlowConfig(BaseSettings):
         return results
 
 
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _read_json_config(file_path: str, keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    Read a JSON config file into a dict.
+    
+    Files over 64 KB are streamed with ijson, keeping only the top-level keys
+    the config declares so unrelated blocks are dropped as they are parsed.
+    Smaller files are parsed in one call, which is faster than streaming.
+    """
+    if IJSON_AVAILABLE and os.path.getsize(file_path) > _JSON_STREAM_THRESHOLD:
+        wanted = set(keys)
+        with open(file_path, 'rb') as f:
+            return {key: value for key, value in ijson.kvitems(f, '', use_float=True) if key in wanted}
+    return _loads_json(Path(file_path).read_bytes())
+
+
+def _construct(model_cls: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """Recursively build a model and its nested models without validation."""
+    values = {}
+    for name, field in model_cls.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if isinstance(value, dict) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = _construct(annotation, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+_CONFIG_SUFFIXES = ('.json', '.yaml', '.yml')
+
+
+def _resolve_config_path(config_path: Optional[str]) -> Optional[str]:
+    """Pick the config file ``load_config`` would read, as an absolute path (None for defaults)."""
+    if config_path and config_path.endswith(_CONFIG_SUFFIXES):
+        return os.path.abspath(config_path)
+    
+    # Try environment variable
+    env_config_path = _ENV_CONFIG_PATH
+    if env_config_path and os.path.isfile(env_config_path) and env_config_path.endswith(_CONFIG_SUFFIXES):
+        return os.path.abspath(env_config_path)
+    
+    # Try default config.json
+    if os.path.isfile('config.json'):
+        return os.path.abspath('config.json')
+    
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_resolved_config(config_path: Optional[str]) -> InfoFlowConfig:
+    """Load (and cache) the config for an already resolved path."""
+    if config_path is None:
+        # Fall back to environment variables and defaults
+        logger.info("No config file found. Using environment variables and defaults.")
+        return InfoFlowConfig()
+    if config_path.endswith(('.yaml', '.yml')):
+        return InfoFlowConfig.from_yaml_file(config_path)
+    return InfoFlowConfig.from_json_file(config_path)
+
+
 def load_config(config_path: Optional[str] = None) -> InfoFlowConfig:
     """
     Load configuration from file or environment variables.
@@ -185,29 +378,16 @@ def load_config(config_path: Optional[str] = None) -> InfoFlowConfig:
     3. config.json in current directory
     4. Environment variables
     5. Default values
-    """
-    if config_path:
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            return InfoFlowConfig.from_yaml_file(config_path)
-        elif config_path.endswith('.json'):
-            return InfoFlowConfig.from_json_file(config_path)
-    
-    # Try environment variable
-    env_config_path = os.getenv('CONFIG_PATH')
-    if env_config_path and Path(env_config_path).exists():
-        if env_config_path.endswith(('.yaml', '.yml')):
-            return InfoFlowConfig.from_yaml_file(env_config_path)
-        elif env_config_path.endswith('.json'):
-            return InfoFlowConfig.from_json_file(env_config_path)
-    
-    # Try default config.json
-    default_config = Path('config.json')
-    if default_config.exists():
-        return InfoFlowConfig.from_json_file(str(default_config))
     
-    # Fall back to environment variables and defaults
-    logger.info("No config file found. Using environment variables and defaults.")
-    return InfoFlowConfig()
+    Results are cached per resolved file, so ``load_config()``,
+    ``load_config(None)`` and the equivalent explicit path all return the
+    same instance; call ``load_config.cache_clear()`` to force a reload
+    (e.g. in tests).
+    """
+    return _load_resolved_config(_resolve_config_path(config_path))
+
+
+load_config.cache_clear = _load_resolved_config.cache_clear
 
 
 # Create global config instance
@@ -0,0 +1,156 @@
+"""
+Shared sentence encoder for InfoFlow MCP Server.
+Loads all-MiniLM-L6-v2 once per process, preferring an int8-quantized ONNX export
+over the fp32 PyTorch model. Backend libraries are only imported when the encoder
+is first requested, so importing this module stays cheap.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+from loguru import logger
+
+import numpy as np
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+# Next to the code rather than under the working directory, so every launch finds the same export
+ONNX_MODEL_DIR = Path(__file__).resolve().parent / "data" / "models" / "all-MiniLM-L6-v2-int8"
+ONNX_MODEL_FILE = "model_quantized.onnx"
+# Both must be present for an export to count as complete
+ONNX_REQUIRED_FILES = (ONNX_MODEL_FILE, "tokenizer_config.json")
+MAX_SEQ_LENGTH = 256  # Matches the sentence-transformers config for this model
+
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+class ONNXEncoder:
+    """
+    Int8-quantized ONNX Runtime encoder.
+
+    Exposes the subset of ``SentenceTransformer.encode`` used by InfoFlow, so
+    either encoder can be dropped in behind ``get_encoder()``.
+    """
+
+    def __init__(self, model_dir: Path = ONNX_MODEL_DIR):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        if not self._is_complete(model_dir):
+            self._export(model_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(model_dir, file_name=ONNX_MODEL_FILE)
+        logger.info(f"Loaded int8 ONNX encoder from {model_dir}")
+
+    @staticmethod
+    def _is_complete(model_dir: Path) -> bool:
+        return all((model_dir / name).exists() for name in ONNX_REQUIRED_FILES)
+
+    @classmethod
+    def _export(cls, model_dir: Path) -> None:
+        """
+        Export the model to ONNX and apply dynamic int8 quantization.
+
+        Everything is written to a temporary sibling directory that is renamed
+        into place only once the model and tokenizer are both saved, so an
+        interrupted export never leaves a half-written ``model_dir`` behind.
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        logger.info(f"Exporting {MODEL_NAME} to quantized ONNX at {model_dir}")
+        model_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{model_dir.name}-", dir=model_dir.parent))
+
+        try:
+            model = ORTModelForFeatureExtraction.from_pretrained(MODEL_NAME, export=True)
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=staging_dir, quantization_config=quantization_config)
+            AutoTokenizer.from_pretrained(MODEL_NAME).save_pretrained(staging_dir)
+
+            # Clear out a partial export left by an older version before swapping in
+            if model_dir.exists() and not cls._is_complete(model_dir):
+                shutil.rmtree(model_dir)
+            try:
+                os.replace(staging_dir, model_dir)
+            except OSError:
+                # Another process finished its export first; keep that one
+                if not cls._is_complete(model_dir):
+                    raise
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """Encode sentences into mean-pooled embeddings."""
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQ_LENGTH,
+                return_tensors="np"
+            )
+            hidden = np.asarray(self.model(**inputs).last_hidden_state, dtype=np.float32)
+
+            # Mean-pool over real tokens only
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+            if normalize_embeddings:
+                pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+            batches.append(pooled)
+
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(batches)
+
+
+def _load_encoder() -> Optional[Any]:
+    """Build the best available encoder, or None if no backend works."""
+    try:
+        return ONNXEncoder()
+    except ImportError:
+        logger.warning("optimum[onnxruntime] not available. Using PyTorch sentence encoder.")
+    except Exception as e:
+        logger.warning(f"Could not load ONNX encoder, falling back to PyTorch: {e}")
+
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("sentence-transformers not available. Using basic filtering only.")
+        return None
+
+    try:
+        model = SentenceTransformer('all-MiniLM-L6-v2')
+        logger.info("Semantic similarity model loaded")
+        return model
+    except Exception as e:
+        logger.warning(f"Could not load similarity model: {e}")
+        return None
+
+
+def get_encoder() -> Optional[Any]:
+    """Return the process-wide sentence encoder, loading it on first call."""
+    global _encoder, _encoder_loaded
+
+    if not _encoder_loaded:
+        with _encoder_lock:
+            if not _encoder_loaded:
+                _encoder = _load_encoder()
+                _encoder_loaded = True
+
+    return _encoder
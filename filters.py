@@ -3,21 +3,148 @@ Intelligent content filtering module for InfoFlow MCP Server.
 Filters content based on relevance, quality, freshness, and user preferences.
 """
 
-import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+import bisect
+import hashlib
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from loguru import logger
 
 try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
 except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    logger.warning("sentence-transformers not available. Using basic filtering only.")
+    DATASKETCH_AVAILABLE = False
+    logger.warning("datasketch not available. Using SimHash duplicate detection.")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not available. Using substring keyword matching.")
 
 import numpy as np
-from models import ContentItem, FilteredResult, FilterCriteria
-from config import FilterConfig, UserPreferences
+# Package-relative when imported as part of the package; flat when run as a script
+if __package__:
+    from .models import ContentItem, FilteredResult, FilterCriteria
+    from .config import FilterConfig, UserPreferences
+    from .encoder import get_encoder
+else:
+    from models import ContentItem, FilteredResult, FilterCriteria
+    from config import FilterConfig, UserPreferences
+    from encoder import get_encoder
+
+URGENCY_KEYWORDS = ['urgent', 'breaking', 'alert', 'critical', 'important', 'deadline']
+
+# SimHash fallback: 64-bit signatures split into 4 bands of 16 bits. Two
+# signatures within SIMHASH_MAX_DISTANCE bits share at least one band exactly
+# (pigeonhole), so band lookups find every candidate pair.
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = 16
+SIMHASH_MAX_DISTANCE = 3
+
+
+def _urgency_numeric_numpy(ages_h: np.ndarray, relevance: np.ndarray) -> np.ndarray:
+    """Recency bucket plus weighted relevance; NaN ages get no recency points."""
+    recency = np.select(
+        [ages_h < 1, ages_h < 24, ages_h < 168, ~np.isnan(ages_h)],  # 168h = 1 week
+        [0.4, 0.3, 0.2, 0.1],
+        default=0.0
+    )
+    return recency + relevance * 0.4
+
+
+def _urgency_numeric_loop(ages_h, relevance):
+    """Loop form of _urgency_numeric_numpy, compiled with Numba when available."""
+    out = np.empty_like(relevance)
+    for i in range(relevance.size):
+        age = ages_h[i]
+        if np.isnan(age):
+            recency = 0.0
+        elif age < 1:
+            recency = 0.4
+        elif age < 24:
+            recency = 0.3
+        elif age < 168:  # 1 week
+            recency = 0.2
+        else:
+            recency = 0.1
+        out[i] = recency + relevance[i] * 0.4
+    return out
+
+
+_urgency_kernel = None
+
+
+def _urgency_numeric(ages_h: np.ndarray, relevance: np.ndarray) -> np.ndarray:
+    """Numeric urgency score; numba is imported and the kernel JIT-compiled on first call."""
+    global _urgency_kernel
+    
+    if _urgency_kernel is None:
+        try:
+            from numba import njit
+            _urgency_kernel = njit(cache=True)(_urgency_numeric_loop)
+        except ImportError:
+            _urgency_kernel = _urgency_numeric_numpy
+    
+    return _urgency_kernel(ages_h, relevance)
+
+
+def _make_hasher() -> Optional[Any]:
+    """
+    Binary bag-of-words hasher for the keyword fallback, or None without scikit-learn.
+    
+    Lowercases and splits on whitespace, same tokens as a plain str.split().
+    """
+    try:
+        from sklearn.feature_extraction.text import HashingVectorizer
+    except ImportError:
+        logger.warning("scikit-learn not available. Using set-based fallback relevance.")
+        return None
+    
+    return HashingVectorizer(
+        n_features=2**18,
+        binary=True,
+        alternate_sign=False,
+        norm=None,
+        tokenizer=str.split,
+        token_pattern=None,
+        dtype=np.float32
+    )
+
+
+def _embedding_text(item: ContentItem) -> str:
+    """Text that gets embedded for an item; shared so embeddings can be reused across stages."""
+    return f"{item.title} {item.content[:500]}"
+
+
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize each row in place; all-zero rows are left as zeros."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings /= np.where(norms > 0, norms, 1.0)
+    return embeddings
+
+
+class KeywordMatcher:
+    """Count distinct keywords occurring in a text with a single Aho-Corasick scan."""
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(sorted({kw.lower() for kw in keywords if kw}))
+        self._automaton = None
+        
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+    
+    def count(self, text: str) -> int:
+        """Return how many distinct keywords appear in ``text`` (expected lowercase)."""
+        if self._automaton is not None:
+            return len({kw for _, kw in self._automaton.iter(text)})
+        return sum(1 for kw in self.keywords if kw in text)
 
 
 class ContentFilter:
@@ -27,14 +154,19 @@ class ContentFilter:
         self.config = config
         self.user_prefs = user_prefs
         
-        # Initialize semantic similarity model if available
-        self.model = None
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
-            try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
-                logger.info("Semantic similarity model loaded")
-            except Exception as e:
-                logger.warning(f"Could not load similarity model: {e}")
+        # Keyword automata, built once per distinct keyword list
+        self._keyword_matchers: Dict[FrozenSet[str], KeywordMatcher] = {}
+        self._get_keyword_matcher(self.config.keywords_set)
+        self._urgency_matcher = KeywordMatcher(URGENCY_KEYWORDS)
+        
+        # Built on first fallback relevance calculation
+        self._hasher = None
+        self._hasher_loaded = False
+    
+    @property
+    def model(self) -> Optional[Any]:
+        """Shared semantic similarity model (None if unavailable), loaded on first use."""
+        return get_encoder()
     
     async def filter_items(
         self,
@@ -44,12 +176,29 @@ class ContentFilter:
         """
         Filter content items based on criteria and user preferences.
         
+        Runs inline on the calling event loop; see filter_items_sync to offload
+        the work to an executor.
+        """
+        return self.filter_items_sync(items, criteria)
+    
+    def filter_items_sync(
+        self,
+        items: List[ContentItem],
+        criteria: Optional[FilterCriteria] = None
+    ) -> FilteredResult:
+        """
+        Filter content items based on criteria and user preferences.
+        
+        Blocking, CPU-bound implementation behind filter_items, safe to run in
+        a worker thread.
+        
         Args:
             items: List of content items to filter
             criteria: Optional filtering criteria (overrides config)
         
         Returns:
-            FilteredResult with filtered items and metadata
+            FilteredResult with filtered items and metadata, ranked best first
+            by relevance * quality
         """
         if not items:
             return FilteredResult(
@@ -65,39 +214,29 @@ class ContentFilter:
         # Use provided criteria or create default
         filter_criteria = criteria or self._default_criteria()
         
-        # Apply filtering pipeline
-        filtered = items.copy()
-        
-        # Step 1: Filter by age/freshness
-        filtered = await self._filter_by_age(filtered, filter_criteria)
-        logger.debug(f"After age filter: {len(filtered)} items")
-        
-        # Step 2: Filter by source
-        filtered = await self._filter_by_source(filtered, filter_criteria)
-        logger.debug(f"After source filter: {len(filtered)} items")
-        
-        # Step 3: Filter by keywords
-        filtered = await self._filter_by_keywords(filtered, filter_criteria)
-        logger.debug(f"After keyword filter: {len(filtered)} items")
+        # Step 1: Filter by age, source and keywords in a single pass
+        filtered = self._select_candidates(items, filter_criteria)
+        logger.debug(f"After age/source/keyword filters: {len(filtered)} items")
         
-        # Step 4: Calculate relevance scores
-        filtered = await self._calculate_relevance(filtered, filter_criteria)
+        # Step 2: Calculate relevance scores (one batched encode)
+        filtered = self._calculate_relevance(filtered, filter_criteria)
         logger.debug(f"After relevance calculation: {len(filtered)} items")
         
-        # Step 5: Calculate quality scores
-        filtered = await self._calculate_quality(filtered)
+        # Step 3: Calculate quality scores
+        filtered = self._calculate_quality(filtered)
         logger.debug(f"After quality calculation: {len(filtered)} items")
         
-        # Step 6: Filter by relevance and quality thresholds
-        filtered = await self._filter_by_scores(filtered, filter_criteria)
+        # Step 4: Filter by relevance and quality thresholds
+        filtered = self._filter_by_scores(filtered, filter_criteria)
         logger.debug(f"After score filtering: {len(filtered)} items")
         
-        # Step 7: Sort by relevance and quality
-        filtered = sorted(
-            filtered,
-            key=lambda x: (x.relevance_score or 0) * (x.quality_score or 0),
-            reverse=True
+        # Step 5: Sort by relevance and quality
+        scores = np.fromiter(
+            ((item.relevance_score or 0) * (item.quality_score or 0) for item in filtered),
+            dtype=np.float64,
+            count=len(filtered)
         )
+        filtered = [filtered[i] for i in np.argsort(-scores, kind='stable')]
         
         logger.info(f"Filtered to {len(filtered)} high-quality items")
         
@@ -109,86 +248,75 @@ class ContentFilter:
             applied_at=datetime.now()
         )
     
-    async def _filter_by_age(
-        self,
-        items: List[ContentItem],
-        criteria: FilterCriteria
-    ) -> List[ContentItem]:
-        """Filter items by publication age."""
-        max_age = criteria.max_age_days or self.config.max_age_days
-        cutoff_date = datetime.now() - timedelta(days=max_age)
-        
-        filtered = []
-        for item in items:
-            if item.published_date:
-                if item.published_date >= cutoff_date:
-                    filtered.append(item)
-            else:
-                # If no date, assume recent and include
-                filtered.append(item)
-        
-        return filtered
-    
-    async def _filter_by_source(
+    def _select_candidates(
         self,
         items: List[ContentItem],
         criteria: FilterCriteria
     ) -> List[ContentItem]:
-        """Filter items by source preferences."""
-        blocked = set(criteria.blocked_sources or self.config.blocked_sources)
-        preferred = set(criteria.preferred_sources or self.config.preferred_sources)
+        """
+        Apply the age, source and keyword filters in one sweep over items.
         
-        filtered = []
+        - Items older than the age limit are dropped (undated items are kept)
+        - Blocked sources are dropped; non-preferred sources get a lower score
+        - When keywords are set, matching items get a boost and only they are
+          kept, unless nothing matches at all, in which case every item is kept
+        """
+        max_age = criteria.max_age_days or self.config.max_age_days
+        cutoff_ts = time.time() - max_age * 86400
+        blocked = criteria.blocked_set or self.config.blocked_set
+        preferred = criteria.preferred_set or self.config.preferred_set
+        keywords = criteria.keywords_set or self.config.keywords_set
+        matcher = self._get_keyword_matcher(keywords) if keywords else None
+        
+        matched = []
+        unmatched = []
         for item in items:
+            # Age/freshness; if no date, assume recent and include
+            published_ts = item.published_ts
+            if published_ts is not None and published_ts < cutoff_ts:
+                continue
+            
             # Block if source is in blocked list
             if item.source in blocked:
                 continue
             
-            # If preferred sources specified, prioritize them
+            # If preferred sources specified, still include others but with lower score
             if preferred and item.source not in preferred:
-                # Still include but with lower score
                 item.relevance_score = (item.relevance_score or 0.5) * 0.7
             
-            filtered.append(item)
-        
-        return filtered
-    
-    async def _filter_by_keywords(
-        self,
-        items: List[ContentItem],
-        criteria: FilterCriteria
-    ) -> List[ContentItem]:
-        """Filter items by keyword matching."""
-        keywords = criteria.keywords or self.config.keywords
-        
-        if not keywords:
-            # No keywords specified, include all
-            return items
-        
-        # Convert keywords to lowercase for case-insensitive matching
-        keywords_lower = [kw.lower() for kw in keywords]
-        
-        filtered = []
-        for item in items:
-            # Check if any keyword appears in title or content
-            text = f"{item.title} {item.content}".lower()
-            
-            match_count = sum(1 for kw in keywords_lower if kw in text)
+            if matcher is None:
+                matched.append(item)
+                continue
             
+            # Check if any keyword appears in title or content
+            match_count = matcher.count(f"{item.title} {item.content}".lower())
             if match_count > 0:
                 # Boost relevance based on keyword matches
                 boost = 1.0 + (match_count * 0.1)
                 item.relevance_score = (item.relevance_score or 0.5) * boost
-                filtered.append(item)
+                matched.append(item)
+            else:
+                unmatched.append(item)
         
-        return filtered if filtered else items  # Return all if no matches
+        return matched if matched else unmatched  # Return all if no keyword matches
     
-    async def _calculate_relevance(
+    def _get_keyword_matcher(self, keywords: FrozenSet[str]) -> KeywordMatcher:
+        """Return a cached matcher for a lowercased keyword set, building it on first use."""
+        matcher = self._keyword_matchers.get(keywords)
+        if matcher is None:
+            matcher = KeywordMatcher(keywords)
+            self._keyword_matchers[keywords] = matcher
+        return matcher
+    
+    def _calculate_relevance(
         self,
         items: List[ContentItem],
         criteria: FilterCriteria
     ) -> List[ContentItem]:
         """Calculate relevance scores for items."""
+        if not items:
+            return items
+        
         if not criteria.query and not self.user_prefs.topics_of_interest:
             # No query or interests, use basic relevance
             for item in items:
@@ -202,34 +330,58 @@ class ContentFilter:
             " ".join(self.user_prefs.topics_of_interest)
         ]).strip()
         
-        if self.model and SENTENCE_TRANSFORMERS_AVAILABLE:
-            # Use semantic similarity
-            try:
-                reference_embedding = self.model.encode([reference_text])[0]
-                
-                for item in items:
-                    item_text = f"{item.title} {item.content[:500]}"
-                    item_embedding = self.model.encode([item_text])[0]
-                    
-                    # Calculate cosine similarity
-                    similarity = np.dot(reference_embedding, item_embedding) / (
-                        np.linalg.norm(reference_embedding) * np.linalg.norm(item_embedding)
-                    )
-                    
-                    item.relevance_score = float(similarity)
-                
-            except Exception as e:
-                logger.error(f"Error calculating semantic similarity: {e}")
-                # Fall back to keyword matching
-                await self._fallback_relevance(items, reference_text)
-        else:
+        if not self.model:
             # Use keyword-based relevance
-            await self._fallback_relevance(items, reference_text)
+            self._fallback_relevance(items, reference_text)
+            return items
+        
+        # Use semantic similarity: encode the reference plus any items not
+        # embedded yet in a single batch
+        pending = [item for item in items if item._embedding is None]
+        try:
+            texts = [_embedding_text(item) for item in pending]
+            embeddings = self.model.encode(texts + [reference_text], batch_size=64, convert_to_numpy=True)
+        except Exception as e:
+            logger.error(f"Error calculating semantic similarity: {e}")
+            # Fall back to keyword matching
+            self._fallback_relevance(items, reference_text)
+            return items
+        
+        # Normalize once and keep each item's embedding for later stages (dedup)
+        embeddings = _normalize_rows(embeddings)
+        for item, embedding in zip(pending, embeddings[:-1]):
+            item._embedding = embedding
+        
+        # With unit-norm rows, cosine similarity is one matrix-vector product
+        similarities = np.stack([item._embedding for item in items]) @ embeddings[-1]
+        
+        for item, similarity in zip(items, similarities.tolist()):
+            item.relevance_score = similarity
         
         return items
     
-    async def _fallback_relevance(self, items: List[ContentItem], reference_text: str):
-        """Fallback relevance calculation using keyword matching."""
+    def _fallback_relevance(self, items: List[ContentItem], reference_text: str):
+        """Fallback relevance calculation using keyword matching (word-set Jaccard similarity)."""
+        if not items:
+            return
+        
+        if not self._hasher_loaded:
+            self._hasher = _make_hasher()
+            self._hasher_loaded = True
+        
+        if self._hasher is not None:
+            # Sparse binary vectors: |A & B| is a dot product, |A | B| = |A| + |B| - |A & B|
+            matrix = self._hasher.transform([f"{item.title} {item.content}" for item in items])
+            reference = self._hasher.transform([reference_text])
+            
+            intersection = (matrix @ reference.T).toarray().ravel().astype(np.float64)
+            union = matrix.getnnz(axis=1) + reference.nnz - intersection
+            similarities = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+            
+            for item, similarity in zip(items, similarities.tolist()):
+                item.relevance_score = similarity
+            return
+        
         reference_words = set(reference_text.lower().split())
         
         for item in items:
@@ -245,47 +397,55 @@ class ContentFilter:
             else:
                 item.relevance_score = 0.0
     
-    async def _calculate_quality(self, items: List[ContentItem]) -> List[ContentItem]:
-        """Calculate quality scores for items."""
-        for item in items:
-            quality_score = 0.5  # Base score
-            
-            # Factor 1: Content length (not too short, not too long)
-            content_length = len(item.content)
-            if 200 <= content_length <= 5000:
-                quality_score += 0.2
-            elif content_length > 5000:
-                quality_score += 0.1
-            
-            # Factor 2: Has URL (indicates real content)
-            if item.url and item.url.startswith('http'):
-                quality_score += 0.1
-            
-            # Factor 3: Has author
-            if item.author:
-                quality_score += 0.1
-            
-            # Factor 4: Has tags
-            if item.tags and len(item.tags) > 0:
-                quality_score += 0.1
-            
-            # Factor 5: Title quality (not all caps, reasonable length)
-            if item.title:
-                if not item.title.isupper():
-                    quality_score += 0.05
-                if 10 <= len(item.title) <= 200:
-                    quality_score += 0.05
-            
-            # Factor 6: Content structure (has paragraphs)
-            if '\n' in item.content:
-                quality_score += 0.1
-            
-            # Normalize to 0-1
-            item.quality_score = min(1.0, quality_score)
+    def _calculate_quality(self, items: List[ContentItem]) -> List[ContentItem]:
+        """
+        Calculate quality scores for items.
+        
+        Each factor is extracted into a parallel array so the scoring itself
+        runs as vectorized NumPy ops instead of per-item branches.
+        """
+        if not items:
+            return items
+        
+        content_len = np.fromiter((len(item.content) for item in items), dtype=np.int64, count=len(items))
+        title_len = np.fromiter((len(item.title or '') for item in items), dtype=np.int64, count=len(items))
+        has_url = np.fromiter((bool(item.url) and item.url.startswith('http') for item in items), dtype=bool, count=len(items))
+        has_author = np.fromiter((bool(item.author) for item in items), dtype=bool, count=len(items))
+        has_tags = np.fromiter((bool(item.tags) for item in items), dtype=bool, count=len(items))
+        not_caps = np.fromiter((bool(item.title) and not item.title.isupper() for item in items), dtype=bool, count=len(items))
+        has_newline = np.fromiter(('\n' in item.content for item in items), dtype=bool, count=len(items))
+        
+        quality = np.full(len(items), 0.5)  # Base score
+        
+        # Factor 1: Content length (not too short, not too long)
+        quality += 0.2 * ((content_len >= 200) & (content_len <= 5000))
+        quality += 0.1 * (content_len > 5000)
+        
+        # Factor 2: Has URL (indicates real content)
+        quality += 0.1 * has_url
+        
+        # Factor 3: Has author
+        quality += 0.1 * has_author
+        
+        # Factor 4: Has tags
+        quality += 0.1 * has_tags
+        
+        # Factor 5: Title quality (not all caps, reasonable length)
+        quality += 0.05 * not_caps
+        quality += 0.05 * ((title_len >= 10) & (title_len <= 200))
+        
+        # Factor 6: Content structure (has paragraphs)
+        quality += 0.1 * has_newline
+        
+        # Normalize to 0-1
+        quality = np.minimum(quality, 1.0)
+        
+        for item, score in zip(items, quality.tolist()):
+            item.quality_score = score
         
         return items
     
-    async def _filter_by_scores(
+    def _filter_by_scores(
         self,
         items: List[ContentItem],
         criteria: FilterCriteria
@@ -316,7 +476,7 @@ class ContentFilter:
             query=""
         )
     
-    async def rank_by_urgency(self, items: List[ContentItem]) -> List[ContentItem]:
+    async def rank_by_urgency(self, items: List[ContentItem]) -> Tuple[List[ContentItem], np.ndarray]:
         """
         Rank items by urgency for decision-making.
         
@@ -324,109 +484,322 @@ class ContentFilter:
         - Recency (newer = more urgent)
         - Relevance score
         - Keywords like "urgent", "breaking", "alert"
+        
+        Returns:
+            The items sorted most urgent first, and a float64 array of their
+            urgency scores in the same order
         """
-        urgency_keywords = ['urgent', 'breaking', 'alert', 'critical', 'important', 'deadline']
+        if not items:
+            return items, np.empty(0, dtype=np.float64)
         
-        def calculate_urgency(item: ContentItem) -> float:
-            score = 0.0
-            
-            # Recency factor (0-0.4)
-            if item.published_date:
-                age_hours = (datetime.now() - item.published_date).total_seconds() / 3600
-                if age_hours < 1:
-                    score += 0.4
-                elif age_hours < 24:
-                    score += 0.3
-                elif age_hours < 168:  # 1 week
-                    score += 0.2
-                else:
-                    score += 0.1
-            
-            # Relevance factor (0-0.4)
-            score += (item.relevance_score or 0.5) * 0.4
-            
-            # Urgency keywords factor (0-0.2)
-            text = f"{item.title} {item.content}".lower()
-            keyword_count = sum(1 for kw in urgency_keywords if kw in text)
-            score += min(0.2, keyword_count * 0.05)
-            
-            return score
+        now_ts = time.time()
+        count = len(items)
         
-        # Calculate urgency for all items
-        for item in items:
-            item.urgency_score = calculate_urgency(item)
+        # Age in hours per item; NaN for undated items (no recency points)
+        ages_h = np.fromiter(
+            (np.nan if item.published_ts is None else (now_ts - item.published_ts) / 3600.0 for item in items),
+            dtype=np.float64,
+            count=count
+        )
+        relevance = np.fromiter((item.relevance_score or 0.5 for item in items), dtype=np.float64, count=count)
+        keyword_counts = np.fromiter(
+            (self._urgency_matcher.count(f"{item.title} {item.content}".lower()) for item in items),
+            dtype=np.float64,
+            count=count
+        )
+        
+        # Recency (0-0.4) + relevance (0-0.4) + urgency keywords (0-0.2)
+        scores = _urgency_numeric(ages_h, relevance) + np.minimum(0.2, keyword_counts * 0.05)
         
-        # Sort by urgency (descending)
-        return sorted(items, key=lambda x: getattr(x, 'urgency_score', 0), reverse=True)
+        for item, score in zip(items, scores.tolist()):
+            item.urgency_score = score
+        
+        # Sort by urgency (descending); stable so ties keep input order
+        order = np.argsort(-scores, kind='stable')
+        return [items[i] for i in order], scores[order]
+
+
+class UrgencyBoard:
+    """
+    Bounded, always-sorted board of the most urgent items seen across calls.
+    
+    Each new item is placed by binary search and the tail beyond ``size`` is
+    dropped, so an incoming item costs O(log size) instead of re-sorting
+    everything seen so far. Older entries fade by ``decay`` per tick; the decay
+    is applied lazily as one shared scale factor rather than rewriting every
+    stored score.
+    """
+    
+    # Fold the scale back into stored scores before it underflows
+    _MIN_SCALE = 1e-6
+    
+    def __init__(self, size: int = 20, decay: float = 0.95):
+        self.size = size
+        self.decay = decay
+        self._scale = 1.0
+        # Negated stored scores, ascending (i.e. most urgent first), with the
+        # matching items in a parallel list
+        self._keys: List[float] = []
+        self._items: List[ContentItem] = []
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def tick(self) -> None:
+        """Age every entry on the board by one decay step."""
+        self._scale *= self.decay
+        if self._scale < self._MIN_SCALE:
+            self._keys = [key * self._scale for key in self._keys]
+            self._scale = 1.0
+    
+    def push(self, item: ContentItem, score: float) -> None:
+        """Insert or refresh an item with its current urgency score."""
+        self._discard(item.content_id)
+        
+        # Stored as score / scale so later ticks decay it along with the rest
+        key = -score / self._scale
+        position = bisect.bisect_right(self._keys, key)
+        if position >= self.size:
+            return
+        
+        self._keys.insert(position, key)
+        self._items.insert(position, item)
+        if len(self._keys) > self.size:
+            self._keys.pop()
+            self._items.pop()
+    
+    def top(self) -> List[Tuple[ContentItem, float]]:
+        """Current board, most urgent first, with decayed scores."""
+        return [(item, -key * self._scale) for key, item in zip(self._keys, self._items)]
+    
+    def _discard(self, content_id: str) -> None:
+        for position, item in enumerate(self._items):
+            if item.content_id == content_id:
+                del self._keys[position]
+                del self._items[position]
+                return
+
+
+class _MinHashIndex:
+    """
+    MinHash signatures over a datasketch LSH index, keyed by position.
+    
+    LSH buckets only approximate the threshold, so a query can return
+    collisions below it; ``matches`` checks the estimated Jaccard similarity
+    against the kept signatures.
+    """
+    
+    def __init__(self, signature: Callable[[ContentItem], "MinHash"], threshold: float, num_perm: int):
+        self.signature = signature
+        self.threshold = threshold
+        self._lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        self._signatures: List["MinHash"] = []
+    
+    def query(self, signature: "MinHash") -> List[int]:
+        return self._lsh.query(signature)
+    
+    def matches(self, signature: "MinHash", positions: List[int]) -> bool:
+        return any(self._signatures[position].jaccard(signature) >= self.threshold for position in positions)
+    
+    def insert(self, position: int, signature: "MinHash") -> None:
+        self._lsh.insert(position, signature)
+        self._signatures.append(signature)
+
+
+class _SimHashIndex:
+    """
+    Banded 64-bit SimHash signatures, keyed by position.
+    
+    Signatures are bucketed by each 16-bit band; a query only compares (by
+    XOR + popcount) against signatures sharing a band and returns those within
+    SIMHASH_MAX_DISTANCE bits.
+    """
+    
+    _BAND_MASK = (1 << SIMHASH_BAND_BITS) - 1
+    
+    def __init__(self, signature: Callable[[ContentItem], int]):
+        self.signature = signature
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._signatures: List[int] = []
+    
+    def _bands(self, signature: int) -> List[Tuple[int, int]]:
+        return [
+            (band, (signature >> (band * SIMHASH_BAND_BITS)) & self._BAND_MASK)
+            for band in range(SIMHASH_BANDS)
+        ]
+    
+    def query(self, signature: int) -> List[int]:
+        positions = {position for key in self._bands(signature) for position in self._buckets.get(key, ())}
+        return [
+            position for position in sorted(positions)
+            if (signature ^ self._signatures[position]).bit_count() <= SIMHASH_MAX_DISTANCE
+        ]
+    
+    def matches(self, signature: int, positions: List[int]) -> bool:
+        # query already dropped every position beyond SIMHASH_MAX_DISTANCE
+        return bool(positions)
+    
+    def insert(self, position: int, signature: int) -> None:
+        for key in self._bands(signature):
+            self._buckets.setdefault(key, []).append(position)
+        self._signatures.append(signature)
 
 
 class DuplicateDetector:
     """Detect and remove duplicate content."""
     
-    def __init__(self, similarity_threshold: float = 0.85):
+    def __init__(self, similarity_threshold: float = 0.85, num_perm: int = 128, shingle_size: int = 5):
         self.similarity_threshold = similarity_threshold
-        self.model = None
-        
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
-            try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
-            except Exception as e:
-                logger.warning(f"Could not load duplicate detection model: {e}")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+    
+    @property
+    def model(self) -> Optional[Any]:
+        """Shared semantic similarity model (None if unavailable), loaded on first use."""
+        return get_encoder()
     
     async def remove_duplicates(self, items: List[ContentItem]) -> List[ContentItem]:
         """Remove duplicate items based on content similarity."""
+        return self.remove_duplicates_sync(items)
+    
+    def remove_duplicates_sync(self, items: List[ContentItem]) -> List[ContentItem]:
+        """Blocking implementation behind remove_duplicates, safe to run in a worker thread."""
         if not items or len(items) <= 1:
             return items
         
+        if DATASKETCH_AVAILABLE:
+            index = _MinHashIndex(self._minhash, self.similarity_threshold, self.num_perm)
+        else:
+            index = _SimHashIndex(self._simhash)
+        unique_items = self._remove_near_duplicates(items, index)
+        
+        logger.info(f"Removed {len(items) - len(unique_items)} duplicates")
+        return unique_items
+    
+    def _remove_near_duplicates(self, items: List[ContentItem], index: Any) -> List[ContentItem]:
+        """
+        Near-duplicate removal over a signature index (MinHash LSH or SimHash).
+        
+        Each kept item is inserted into the index once; only items whose
+        signature collides with an already kept item go through the
+        (expensive) semantic confirmation.
+        """
         unique_items = []
-        seen_hashes = set()
+        seen = set()
         
         for item in items:
-            # Quick check: exact URL match
-            if item.url in seen_hashes:
+            # Quick check: exact URL or title match via cached fingerprints
+            url_fingerprint = item.url_fingerprint
+            title_fingerprint = item.title_fingerprint
+            if url_fingerprint in seen or title_fingerprint in seen:
                 continue
             
-            # Quick check: exact title match
-            title_hash = hash(item.title.lower())
-            if title_hash in seen_hashes:
+            signature = index.signature(item)
+            positions = index.query(signature)
+            if positions and self._confirm_duplicate(
+                item,
+                [unique_items[position] for position in positions],
+                lambda: index.matches(signature, positions)
+            ):
                 continue
             
-            # Semantic similarity check (if available)
-            if self.model and unique_items:
-                is_duplicate = await self._check_semantic_duplicate(item, unique_items)
-                if is_duplicate:
-                    continue
-            
+            # Index keys are positions in unique_items, so hits map straight back
+            index.insert(len(unique_items), signature)
             unique_items.append(item)
-            if item.url:
-                seen_hashes.add(item.url)
-            seen_hashes.add(title_hash)
+            if url_fingerprint is not None:
+                seen.add(url_fingerprint)
+            seen.add(title_fingerprint)
         
-        logger.info(f"Removed {len(items) - len(unique_items)} duplicates")
         return unique_items
     
-    async def _check_semantic_duplicate(
+    def _shingles(self, item: ContentItem) -> List[str]:
+        """Word shingles of title and content shared by the MinHash and SimHash signatures."""
+        words = f"{item.title} {item.content[:2000]}".lower().split()
+        size = self.shingle_size
+        
+        if len(words) < size:
+            # Too short to shingle; treat the whole text as one shingle
+            return [" ".join(words)]
+        return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    
+    def _minhash(self, item: ContentItem) -> "MinHash":
+        """Build a MinHash signature from word shingles of title and content."""
+        signature = MinHash(num_perm=self.num_perm)
+        for shingle in self._shingles(item):
+            signature.update(shingle.encode())
+        
+        return signature
+    
+    def _simhash(self, item: ContentItem) -> int:
+        """Build a 64-bit SimHash signature from word shingles of title and content."""
+        shingles = self._shingles(item)
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little") for shingle in shingles],
+            dtype="<u8"
+        )
+        
+        # Each bit of the signature is the majority vote of that bit across shingles
+        bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+        majority = bits.sum(axis=0) * 2 > len(shingles)
+        return int(np.packbits(majority, bitorder="little").view("<u8")[0])
+    
+    def _confirm_duplicate(
         self,
         item: ContentItem,
-        existing_items: List[ContentItem]
+        candidates: List[ContentItem],
+        signature_match: Callable[[], bool]
     ) -> bool:
-        """Check if item is semantically duplicate of existing items."""
+        """
+        Confirm a signature index collision.
+        
+        Collisions are confirmed semantically when a similarity model is
+        available. Without one, or if encoding fails, ``signature_match``
+        decides: the estimated similarity between the item's signature and a
+        candidate's must reach the threshold, not just share an LSH bucket.
+        """
+        if not self.model:
+            return signature_match()
+        
+        # Encodes only whichever of the item and its candidates lack an embedding
+        if not self._encode_items([item, *candidates]):
+            return signature_match()
+        
+        return self._check_semantic_duplicate(
+            item._embedding,
+            [candidate._embedding for candidate in candidates]
+        )
+    
+    def _encode_items(self, items: List[ContentItem]) -> bool:
+        """
+        Make sure every item carries an L2-normalized embedding.
+        
+        Embeddings already attached (e.g. by relevance scoring) are reused; the
+        rest are encoded in one batch. Returns False if encoding failed.
+        """
+        pending = [item for item in items if item._embedding is None]
+        if not pending:
+            return True
+        
         try:
-            item_text = f"{item.title} {item.content[:500]}"
-            item_embedding = self.model.encode([item_text])[0]
-            
-            for existing in existing_items[-5:]:  # Check against last 5 items only
-                existing_text = f"{existing.title} {existing.content[:500]}"
-                existing_embedding = self.model.encode([existing_text])[0]
-                
-                similarity = np.dot(item_embedding, existing_embedding) / (
-                    np.linalg.norm(item_embedding) * np.linalg.norm(existing_embedding)
-                )
-                
-                if similarity >= self.similarity_threshold:
-                    return True
-            
+            texts = [_embedding_text(item) for item in pending]
+            embeddings = self.model.encode(texts, batch_size=64, convert_to_numpy=True)
+        except Exception as e:
+            logger.error(f"Error encoding items for duplicate detection: {e}")
             return False
+        
+        for item, embedding in zip(pending, _normalize_rows(embeddings)):
+            item._embedding = embedding
+        return True
+    
+    def _check_semantic_duplicate(
+        self,
+        item_embedding: np.ndarray,
+        existing_embeddings: List[np.ndarray]
+    ) -> bool:
+        """Check if an embedding is a semantic duplicate of any existing embedding."""
+        try:
+            similarities = np.stack(existing_embeddings) @ item_embedding
+            return bool(similarities.max() >= self.similarity_threshold)
             
         except Exception as e:
             logger.error(f"Error in semantic duplicate check: {e}")
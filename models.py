@@ -1,10 +1,63 @@
 """
 Data models for InfoFlow MCP Server
 """
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Annotated, Literal, Optional, List, Dict, Any, FrozenSet, Iterable, Iterator, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PrivateAttr
+
+
+# Datetimes serialize to ISO 8601 strings in JSON mode (replaces the v1 json_encoders)
+Timestamp = Annotated[datetime, PlainSerializer(lambda v: v.isoformat(), return_type=str, when_used="json")]
+
+# Shared by every model: ignore unknown input keys, no validation on attribute assignment
+_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
+
+
+# Pinned "now" for the request being handled; unset outside request_clock()
+_request_time: ContextVar[Optional[datetime]] = ContextVar("request_time", default=None)
+
+
+def current_request_time() -> datetime:
+    """Timestamp default for models: the pinned request time, or utcnow() outside a request"""
+    pinned = _request_time.get()
+    return pinned if pinned is not None else datetime.utcnow()
+
+
+@contextmanager
+def request_clock() -> Iterator[datetime]:
+    """Pin current_request_time() to a single utcnow() reading for the enclosed block"""
+    token = _request_time.set(datetime.utcnow())
+    try:
+        yield _request_time.get()
+    finally:
+        _request_time.reset(token)
+
+
+def invalidate_cached(model: BaseModel, changed: Iterable[str], derived: Dict[str, Tuple[str, ...]]) -> None:
+    """
+    Drop values cached on a model instance that were derived from any changed field.
+
+    ``derived`` maps a field name to the cached_property names and private
+    attributes computed from it; private attributes are reset to None.
+    """
+    private = model.__pydantic_private__
+    for field in changed:
+        for name in derived.get(field, ()):
+            if private is not None and name in private:
+                private[name] = None
+            else:
+                model.__dict__.pop(name, None)
+
+
+def _fingerprint(kind: bytes, value: str) -> int:
+    """64-bit blake2b fingerprint of a value, namespaced by kind"""
+    digest = hashlib.blake2b(kind + b"\0" + value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
 
 
 class RiskTolerance(str, Enum):
@@ -38,53 +91,163 @@ class DecisionStatus(str, Enum):
     REVIEWED = "reviewed"
 
 
+# Field types for the enums above. Pydantic validates Literal values with a
+# direct lookup, cheaper than Enum validation; enum members are str subclasses,
+# so they are still accepted as input and compare equal to the stored values.
+RiskToleranceValue = Literal["low", "medium", "high"]
+DecisionStyleValue = Literal["analytical", "intuitive", "collaborative"]
+PriorityLevelValue = Literal["critical", "high", "medium", "low", "minimal"]
+DecisionStatusValue = Literal["pending", "decided", "implemented", "reviewed"]
+
+
 class UserProfile(BaseModel):
     """User profile model"""
+    model_config = _MODEL_CONFIG
+
     user_id: str = Field(..., description="Unique user identifier")
     name: str = Field(..., description="User's name")
     interests: List[str] = Field(default_factory=list, description="List of user interests")
     preferences: Dict[str, Any] = Field(default_factory=dict, description="User preferences")
-    risk_tolerance: RiskTolerance = Field(default=RiskTolerance.MEDIUM)
-    decision_style: DecisionStyle = Field(default=DecisionStyle.ANALYTICAL)
+    risk_tolerance: RiskToleranceValue = Field(default=RiskTolerance.MEDIUM.value)
+    decision_style: DecisionStyleValue = Field(default=DecisionStyle.ANALYTICAL.value)
     notification_threshold: int = Field(default=3, ge=1, le=5, description="Priority level for notifications (1-5)")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Timestamp = Field(default_factory=current_request_time)
+    updated_at: Timestamp = Field(default_factory=current_request_time)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+
+# Values cached on a ContentItem, by the field they are derived from
+_CONTENT_ITEM_DERIVED = {
+    "url": ("url_fingerprint",),
+    "title": ("title_fingerprint", "_embedding"),
+    "content": ("_embedding",),
+    "published_date": ("_published_ts",),
+}
+
+# Values cached on a FilterCriteria, by the field they are derived from
+_FILTER_CRITERIA_DERIVED = {
+    "blocked_sources": ("blocked_set",),
+    "preferred_sources": ("preferred_set",),
+    "keywords": ("keywords_set",),
+}
 
 
 class ContentItem(BaseModel):
-    """Content item to be filtered/synthesized"""
+    """
+    Content item to be filtered/synthesized
+
+    url, title, content and published_date are treated as immutable once an item
+    is ingested: fingerprints, the POSIX timestamp and the embedding are cached
+    from them on first use, and plain attribute assignment does not refresh
+    those caches. Use model_copy(update=...) to change them.
+    """
+    model_config = _MODEL_CONFIG
+
     content_id: str = Field(..., description="Unique content identifier")
     title: str = Field(..., description="Content title")
     content: str = Field(..., description="Content text")
     source: Optional[str] = Field(None, description="Content source")
     url: Optional[str] = Field(None, description="Content URL")
+    author: Optional[str] = Field(None, description="Content author")
+    content_type: Optional[str] = Field(None, description="Content type (article, news, video, ...)")
     tags: List[str] = Field(default_factory=list, description="Content tags")
     relevance_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="Relevance score (0-1)")
-    priority: Optional[PriorityLevel] = Field(None, description="Assigned priority level")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    quality_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="Quality score (0-1), set by filtering")
+    urgency_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="Urgency score (0-1), set by urgency ranking")
+    priority: Optional[PriorityLevelValue] = Field(None, description="Assigned priority level")
+    published_date: Optional[Timestamp] = Field(None, description="Publication date")
+    created_at: Timestamp = Field(default_factory=current_request_time)
+
+    _published_ts: Optional[float] = PrivateAttr(default=None)
+    # L2-normalized float32 embedding, attached by the first stage that encodes the item
+    _embedding: Optional[Any] = PrivateAttr(default=None)
+
+    @property
+    def published_ts(self) -> Optional[float]:
+        """POSIX timestamp of published_date, computed once on first access"""
+        if self._published_ts is None and self.published_date is not None:
+            self._published_ts = self.published_date.timestamp()
+        return self._published_ts
+
+    @cached_property
+    def url_fingerprint(self) -> Optional[int]:
+        """Fingerprint of the URL for exact-duplicate checks (None without a URL)"""
+        return _fingerprint(b"url", self.url) if self.url else None
+
+    @cached_property
+    def title_fingerprint(self) -> int:
+        """Fingerprint of the case-folded title for exact-duplicate checks"""
+        return _fingerprint(b"title", self.title.lower())
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ContentItem":
+        """Copy the item, dropping cached values derived from any updated field"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            invalidate_cached(copied, update, _CONTENT_ITEM_DERIVED)
+        return copied
 
 
 class FilterCriteria(BaseModel):
-    """Criteria for filtering content"""
-    user_id: str
+    """
+    Criteria for filtering content
+
+    The model is not frozen, but blocked_sources, preferred_sources and keywords
+    are cached as frozensets (blocked_set, preferred_set, keywords_set) on first
+    use, and assigning to those fields leaves the sets stale. Use
+    model_copy(update=...) to change them.
+    """
+    model_config = _MODEL_CONFIG
+
+    user_id: str = Field(default="default", description="User the criteria apply to")
+    query: str = Field(default="", description="Search query to match against")
+    relevance_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Minimum relevance (None: config default)")
+    quality_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Minimum quality (None: config default)")
+    max_age_days: Optional[int] = Field(None, ge=1, description="Maximum age in days (None: config default)")
     min_relevance: float = Field(default=0.3, ge=0.0, le=1.0)
     min_priority: int = Field(default=3, ge=1, le=5)
     interests: Optional[List[str]] = None
     exclude_tags: List[str] = Field(default_factory=list)
+    preferred_sources: List[str] = Field(default_factory=list)
+    blocked_sources: List[str] = Field(default_factory=list)
+    keywords: List[str] = Field(default_factory=list)
+
+    @cached_property
+    def blocked_set(self) -> FrozenSet[str]:
+        """Blocked sources as a frozenset, built once per instance"""
+        return frozenset(self.blocked_sources)
+
+    @cached_property
+    def preferred_set(self) -> FrozenSet[str]:
+        """Preferred sources as a frozenset, built once per instance"""
+        return frozenset(self.preferred_sources)
+
+    @cached_property
+    def keywords_set(self) -> FrozenSet[str]:
+        """Lowercased keywords as a frozenset, built once per instance"""
+        return frozenset(kw.lower() for kw in self.keywords if kw)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "FilterCriteria":
+        """Copy the criteria, dropping cached sets derived from any updated field"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            invalidate_cached(copied, update, _FILTER_CRITERIA_DERIVED)
+        return copied
+
+
+class FilteredResult(BaseModel):
+    """Result of a filtering pass"""
+    model_config = _MODEL_CONFIG
+
+    filtered_items: List[ContentItem] = Field(default_factory=list, description="Items that passed, ranked best first")
+    total_processed: int = Field(..., ge=0, description="Number of items considered")
+    total_filtered: int = Field(..., ge=0, description="Number of items that passed")
+    filter_criteria: FilterCriteria
+    applied_at: Timestamp = Field(default_factory=current_request_time)
 
 
 class SynthesisRequest(BaseModel):
     """Request for synthesizing information"""
+    model_config = _MODEL_CONFIG
+
     user_id: str
     sources: List[ContentItem] = Field(..., description="Sources to synthesize")
     focus_areas: List[str] = Field(default_factory=list, description="Areas to focus on")
@@ -93,22 +256,21 @@ class SynthesisRequest(BaseModel):
 
 class SynthesisResult(BaseModel):
     """Result of information synthesis"""
+    model_config = _MODEL_CONFIG
+
     summary: str = Field(..., description="Synthesized summary")
     key_themes: List[str] = Field(default_factory=list, description="Key themes identified")
     consensus_points: List[str] = Field(default_factory=list, description="Points of consensus")
     contradictions: List[str] = Field(default_factory=list, description="Contradictions found")
     actionable_insights: List[str] = Field(default_factory=list, description="Actionable insights")
     sources_used: int = Field(..., description="Number of sources used")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    created_at: Timestamp = Field(default_factory=current_request_time)
 
 
 class DecisionOption(BaseModel):
     """An option in a decision"""
+    model_config = _MODEL_CONFIG
+
     option_id: str
     name: str
     description: str
@@ -121,6 +283,8 @@ class DecisionOption(BaseModel):
 
 class Decision(BaseModel):
     """Decision model"""
+    model_config = _MODEL_CONFIG
+
     decision_id: str
     user_id: str
     title: str
@@ -128,23 +292,20 @@ class Decision(BaseModel):
     context: str = Field(default="", description="Additional context for the decision")
     options: List[DecisionOption] = Field(default_factory=list)
     criteria: List[str] = Field(default_factory=list, description="Decision criteria")
-    status: DecisionStatus = Field(default=DecisionStatus.PENDING)
+    status: DecisionStatusValue = Field(default=DecisionStatus.PENDING.value)
     selected_option: Optional[str] = None
     rationale: Optional[str] = None
     outcome: Optional[str] = None
     feedback_score: Optional[int] = Field(None, ge=1, le=5)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    decided_at: Optional[datetime] = None
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    created_at: Timestamp = Field(default_factory=current_request_time)
+    updated_at: Timestamp = Field(default_factory=current_request_time)
+    decided_at: Optional[Timestamp] = None
 
 
 class DecisionRecommendation(BaseModel):
     """AI recommendation for a decision"""
+    model_config = _MODEL_CONFIG
+
     decision_id: str
     recommended_option: str
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence in recommendation (0-1)")
@@ -152,45 +313,34 @@ class DecisionRecommendation(BaseModel):
     considerations: List[str] = Field(default_factory=list)
     risk_assessment: str
     alternative_suggestions: List[str] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    created_at: Timestamp = Field(default_factory=current_request_time)
 
 
 class MonitoredTopic(BaseModel):
     """Topic being monitored"""
+    model_config = _MODEL_CONFIG
+
     topic_id: str
     user_id: str
     name: str
     description: str
     keywords: List[str] = Field(default_factory=list)
     priority_threshold: int = Field(default=3, ge=1, le=5)
-    last_checked: Optional[datetime] = None
+    last_checked: Optional[Timestamp] = None
     alert_count: int = Field(default=0)
     active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    created_at: Timestamp = Field(default_factory=current_request_time)
 
 
 class TopicAlert(BaseModel):
     """Alert for a monitored topic"""
+    model_config = _MODEL_CONFIG
+
     alert_id: str
     topic_id: str
     user_id: str
     content_id: str
     message: str
-    priority: PriorityLevel
+    priority: PriorityLevelValue
     read: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    created_at: Timestamp = Field(default_factory=current_request_time)
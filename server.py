@@ -4,9 +4,18 @@ Exposes tools for combating information overload and decision fatigue.
 """
 
 import asyncio
+import bisect
+import contextvars
+import functools
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 from loguru import logger
+import numpy as np
+from pydantic import TypeAdapter
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -16,10 +25,21 @@ except ImportError:
     MCP_AVAILABLE = False
     logger.error("MCP not available. Install with: pip install mcp")
 
-from models import ContentItem, FilterCriteria, DecisionRequest, SynthesisRequest
-from config import load_config
-from storage import StorageManager
-from filters import ContentFilter, DuplicateDetector
+# Package-relative under `python -m <package>.server`; flat when run as `python server.py`
+if __package__:
+    from .models import ContentItem, FilterCriteria, request_clock
+    from .config import load_config
+    from .storage import StorageManager
+    from .filters import ContentFilter, DuplicateDetector, UrgencyBoard
+    from .cache import ScorerCache, make_key
+    from .encoder import get_encoder
+else:
+    from models import ContentItem, FilterCriteria, request_clock
+    from config import load_config
+    from storage import StorageManager
+    from filters import ContentFilter, DuplicateDetector, UrgencyBoard
+    from cache import ScorerCache, make_key
+    from encoder import get_encoder
 
 # Load configuration
 config = load_config()
@@ -31,9 +51,69 @@ mcp = FastMCP("InfoFlow MCP Server") if MCP_AVAILABLE else None
 storage = StorageManager(config.storage)
 content_filter = ContentFilter(config.filter, config.user)
 duplicate_detector = DuplicateDetector()
+urgency_board = UrgencyBoard()
+scorer_cache = ScorerCache(config.storage.scorer_cache_path)
+
+# Version of the cached summary/pros/cons helpers; bump it whenever their output
+# changes (e.g. when they move to an LLM) so stale cache entries are not served
+_SCORER_VERSION = "heuristic-1"
+
+# CPU-bound filtering and dedup run here so they don't block the event loop
+cpu_pool = ThreadPoolExecutor(max_workers=config.cpu_workers, thread_name_prefix="infoflow-cpu")
+
+# Strong references to in-flight background tasks (the loop only keeps weak ones)
+_pending_tasks = set()
+
+# Built once at import and reused for every request's item payload
+_ITEMS_ADAPTER = TypeAdapter(List[ContentItem])
+
+# filter_content returns at most this many items
+MAX_FILTERED_RESULTS = 20
+
+# Lower bounds (inclusive) of each urgency level above "low"
+_URGENCY_BUCKETS = [0.4, 0.6, 0.8]
+_URGENCY_LABELS = ["low", "medium", "high", "critical"]
+_URGENCY_LABEL_ARRAY = np.array(_URGENCY_LABELS)
+
+# Fetches (title, url, source) for a source citation in one C-level call
+_citation_fields = attrgetter("title", "url", "source")
+
+# Text up to the first period; matching stops there instead of splitting the whole content
+_FIRST_SENTENCE = re.compile(r"[^.]*")
+
+
+def _request_scoped(func):
+    """Pin model timestamp defaults to one clock reading for the duration of a tool call."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with request_clock():
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+async def _run_cpu(func, *args):
+    """Run a blocking function on the CPU pool, keeping the caller's request clock."""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(cpu_pool, functools.partial(ctx.run, func, *args))
+
+
+def _log_task_result(task: asyncio.Task) -> None:
+    """Done-callback for background tasks: release the reference and log failures."""
+    _pending_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background task {task.get_name()} failed: {task.exception()}")
+
+
+def _spawn(coro, name: str) -> asyncio.Task:
+    """Schedule a coroutine off the response path, keeping it alive until it finishes."""
+    task = asyncio.create_task(coro, name=name)
+    _pending_tasks.add(task)
+    task.add_done_callback(_log_task_result)
+    return task
 
 
 @mcp.tool()
+@_request_scoped
 async def filter_content(
     content_items: List[Dict[str, Any]],
     query: Optional[str] = None,
@@ -55,10 +135,9 @@ async def filter_content(
         Filtered and ranked content items with scores
     """
     try:
-        logger.info(f"Filtering {len(content_items)} content items")
-        
-        # Convert dict items to ContentItem objects
-        items = [ContentItem(**item) for item in content_items]
+        # Convert incoming items to ContentItem objects
+        items = _load_items(content_items)
+        logger.info(f"Filtering {len(items)} content items")
         
         # Create filter criteria
         criteria = FilterCriteria(
@@ -69,16 +148,17 @@ async def filter_content(
         )
         
         # Apply filtering
-        result = await content_filter.filter_items(items, criteria)
+        result = await _run_cpu(content_filter.filter_items_sync, items, criteria)
         
-        # Remove duplicates
-        unique_items = await duplicate_detector.remove_duplicates(result.filtered_items)
+        # Remove duplicates; filter_items returns items already ranked, so the
+        # detector keeps the best-ranked copy and the head of the list is the top N
+        unique_items = await _run_cpu(duplicate_detector.remove_duplicates_sync, result.filtered_items)
         
-        # Store filtered results
-        await storage.store_filtered_results(result)
+        # Store filtered results in the background; the response doesn't depend on it
+        _spawn(storage.store_filtered_results(result), name="store_filtered_results")
         
         return {
-            "filtered_items": [item.model_dump() for item in unique_items[:20]],  # Top 20
+            "filtered_items": _ITEMS_ADAPTER.dump_python(unique_items[:MAX_FILTERED_RESULTS], mode="json"),
             "total_processed": result.total_processed,
             "total_filtered": len(unique_items),
             "filter_summary": {
@@ -94,6 +174,7 @@ async def filter_content(
 
 
 @mcp.tool()
+@_request_scoped
 async def synthesize_information(
     content_items: List[Dict[str, Any]],
     focus: Optional[str] = None,
@@ -113,17 +194,16 @@ async def synthesize_information(
         Synthesized summary with key points and sources
     """
     try:
-        logger.info(f"Synthesizing {len(content_items)} content items")
-        
-        items = [ContentItem(**item) for item in content_items]
+        items = _load_items(content_items)
+        logger.info(f"Synthesizing {len(items)} content items")
         
         # Extract key information
         summary = {
             "executive_summary": await _generate_summary(items, focus, max_length),
             "key_points": await _extract_key_points(items, focus),
             "themes": await _identify_themes(items),
-            "sources": [{"title": item.title, "url": item.url, "source": item.source} 
-                       for item in items] if include_sources else [],
+            "sources": [{"title": title, "url": url, "source": source}
+                        for title, url, source in map(_citation_fields, items)] if include_sources else [],
             "synthesized_at": datetime.now().isoformat()
         }
         
@@ -165,20 +245,12 @@ async def support_decision(
             "next_steps": []
         }
         
-        # Analyze each option
-        for option in options:
-            option_analysis = {
-                "option": option,
-                "pros": await _analyze_pros(option, decision_context, factors),
-                "cons": await _analyze_cons(option, decision_context, factors),
-                "overall_score": 0.0,
-                "risk_level": "medium"
-            }
-            
-            # Calculate score based on pros/cons
-            option_analysis["overall_score"] = len(option_analysis["pros"]) - len(option_analysis["cons"]) * 0.5
-            
-            analysis["options_analysis"].append(option_analysis)
+        # Analyze every option and assess risks concurrently
+        *options_analysis, analysis["risk_assessment"] = await asyncio.gather(
+            *(_analyze_option(option, decision_context, factors) for option in options),
+            _assess_risks(decision_context, options)
+        )
+        analysis["options_analysis"] = options_analysis
         
         # Sort options by score
         analysis["options_analysis"].sort(key=lambda x: x["overall_score"], reverse=True)
@@ -192,10 +264,7 @@ async def support_decision(
                 "confidence": min(0.9, best_option["overall_score"] / len(options))
             }
         
-        # Risk assessment
-        analysis["risk_assessment"] = await _assess_risks(decision_context, options)
-        
-        # Next steps
+        # Next steps (depend on the recommendation, so run last)
         analysis["next_steps"] = await _suggest_next_steps(decision_context, analysis["recommendation"])
         
         return analysis
@@ -206,12 +275,16 @@ async def support_decision(
 
 
 @mcp.tool()
+@_request_scoped
 async def rank_by_urgency(
     content_items: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """
     Rank content items by urgency to help prioritize what needs immediate attention.
     
+    Every call also ages and updates the urgency board shared by all clients
+    of this server process (see get_urgency_board).
+    
     Args:
         content_items: List of content items to rank
     
@@ -219,21 +292,25 @@ async def rank_by_urgency(
         Items ranked by urgency with urgency scores
     """
     try:
-        items = [ContentItem(**item) for item in content_items]
+        items = _load_items(content_items)
         
         # Rank by urgency
-        ranked_items = await content_filter.rank_by_urgency(items)
+        ranked_items, scores = await content_filter.rank_by_urgency(items)
+        
+        # Age the standing board by one step, then merge in this batch
+        urgency_board.tick()
+        for item, score in zip(ranked_items, scores.tolist()):
+            urgency_board.push(item, score)
+        
+        # Classify every score in one pass (same inclusive thresholds as _classify_urgency)
+        levels = _URGENCY_LABEL_ARRAY[np.digitize(scores, _URGENCY_BUCKETS)]
         
         return {
             "ranked_items": [
-                {
-                    **item.model_dump(),
-                    "urgency_score": getattr(item, 'urgency_score', 0.5),
-                    "urgency_level": _classify_urgency(getattr(item, 'urgency_score', 0.5))
-                }
-                for item in ranked_items
+                {**dumped, "urgency_level": level}
+                for dumped, level in zip(_ITEMS_ADAPTER.dump_python(ranked_items, mode="json"), levels.tolist())
             ],
-            "urgent_count": sum(1 for item in ranked_items if getattr(item, 'urgency_score', 0) > 0.7),
+            "urgent_count": int((scores > 0.7).sum()),
             "ranked_at": datetime.now().isoformat()
         }
         
@@ -243,6 +320,42 @@ async def rank_by_urgency(
 
 
 @mcp.tool()
+@_request_scoped
+async def get_urgency_board() -> Dict[str, Any]:
+    """
+    Get the standing list of the most urgent items seen across rank_by_urgency calls.
+    
+    The board is process-wide: it is shared by every client connected to this
+    server, and its scores decay one step on each rank_by_urgency call from
+    any client. Items that stop showing up gradually give way to fresher ones.
+    
+    Returns:
+        Up to the 20 most urgent items, with their decayed urgency scores
+    """
+    try:
+        board = urgency_board.top()
+        dumped_items = _ITEMS_ADAPTER.dump_python([item for item, _ in board], mode="json")
+        
+        return {
+            "board": [
+                {
+                    **dumped,
+                    "urgency_score": score,
+                    "urgency_level": _classify_urgency(score)
+                }
+                for dumped, (_, score) in zip(dumped_items, board)
+            ],
+            "board_size": len(board),
+            "retrieved_at": datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error reading urgency board: {e}")
+        return {"error": str(e)}
+
+
+@mcp.tool()
+@_request_scoped
 async def search_stored_content(
     query: str,
     limit: int = 10,
@@ -267,7 +380,7 @@ async def search_stored_content(
         items = await storage.search_items(query, limit, filters)
         
         return {
-            "results": [item.model_dump() for item in items],
+            "results": _ITEMS_ADAPTER.dump_python(items, mode="json"),
             "total_results": len(items),
             "query": query
         }
@@ -295,6 +408,14 @@ async def get_storage_stats() -> Dict[str, Any]:
 
 # Helper functions
 
+def _load_items(content_items: List[Dict[str, Any]]) -> List[ContentItem]:
+    """Validate incoming content items in one pass through the shared adapter."""
+    return _ITEMS_ADAPTER.validate_python(content_items)
+
+
+@scorer_cache.cached(key=lambda items, focus, max_length: make_key(
+    [(item.title, item.content[:200]) for item in items[:5]], len(items), focus, max_length
+), version=_SCORER_VERSION)
 async def _generate_summary(items: List[ContentItem], focus: Optional[str], max_length: int) -> str:
     """Generate executive summary of content items."""
     # Combine all content
@@ -315,11 +436,9 @@ async def _extract_key_points(items: List[ContentItem], focus: Optional[str]) ->
     
     for item in items[:10]:  # Top 10 items
         # Extract first sentence or key phrase
-        sentences = item.content.split('.')
-        if sentences:
-            key_point = sentences[0].strip()
-            if key_point and len(key_point) > 20:
-                key_points.append(key_point)
+        key_point = _FIRST_SENTENCE.match(item.content).group().strip()
+        if len(key_point) > 20:
+            key_points.append(key_point)
     
     return key_points[:5]  # Top 5 key points
 
@@ -327,20 +446,37 @@ async def _extract_key_points(items: List[ContentItem], focus: Optional[str]) ->
 async def _identify_themes(items: List[ContentItem]) -> List[Dict[str, Any]]:
     """Identify common themes across content items."""
     # Simple theme identification based on tags
-    theme_counts = {}
+    theme_counts = Counter()
     
     for item in items:
-        for tag in item.tags:
-            theme_counts[tag] = theme_counts.get(tag, 0) + 1
+        theme_counts.update(item.tags)
     
     themes = [
         {"theme": theme, "frequency": count}
-        for theme, count in sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        for theme, count in theme_counts.most_common(5)
     ]
     
     return themes
 
 
+async def _analyze_option(option: str, context: str, factors: Optional[List[str]]) -> Dict[str, Any]:
+    """Analyze a single option, gathering its pros and cons concurrently."""
+    pros, cons = await asyncio.gather(
+        _analyze_pros(option, context, factors),
+        _analyze_cons(option, context, factors)
+    )
+    
+    return {
+        "option": option,
+        "pros": pros,
+        "cons": cons,
+        # Calculate score based on pros/cons
+        "overall_score": len(pros) - len(cons) * 0.5,
+        "risk_level": "medium"
+    }
+
+
+@scorer_cache.cached(key=lambda option, context, factors: make_key(option, context, factors or []), version=_SCORER_VERSION)
 async def _analyze_pros(option: str, context: str, factors: Optional[List[str]]) -> List[str]:
     """Analyze pros of an option."""
     # Simple pros analysis (in production, use LLM)
@@ -355,6 +491,7 @@ async def _analyze_pros(option: str, context: str, factors: Optional[List[str]])
     return pros
 
 
+@scorer_cache.cached(key=lambda option, context, factors: make_key(option, context, factors or []), version=_SCORER_VERSION)
 async def _analyze_cons(option: str, context: str, factors: Optional[str]) -> List[str]:
     """Analyze cons of an option."""
     # Simple cons analysis (in production, use LLM)
@@ -399,14 +536,7 @@ async def _suggest_next_steps(context: str, recommendation: Optional[Dict]) -> L
 
 def _classify_urgency(score: float) -> str:
     """Classify urgency level based on score."""
-    if score >= 0.8:
-        return "critical"
-    elif score >= 0.6:
-        return "high"
-    elif score >= 0.4:
-        return "medium"
-    else:
-        return "low"
+    return _URGENCY_LABELS[bisect.bisect_right(_URGENCY_BUCKETS, score)]
 
 
 # Run the server
@@ -420,6 +550,10 @@ if __name__ == "__main__":
         # Validate API keys
         api_status = config.validate_api_keys()
         
+        # Load (and on first launch, export) the encoder in the background so the
+        # first filtering request doesn't pay for it; callers block on its lock
+        cpu_pool.submit(get_encoder)
+        
         # Run the MCP server
         mcp.run()
     else:
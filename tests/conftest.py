@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the flat server modules (models, filters, ...) importable.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
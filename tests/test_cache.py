@@ -0,0 +1,45 @@
+"""
+Tests for the persistent scorer cache and its decorator.
+"""
+
+import asyncio
+
+from cache import ScorerCache, make_key
+
+
+def _counting_scorer(cache: ScorerCache, version: str, calls: list):
+    @cache.cached(key=lambda text: make_key(text), version=version)
+    async def score(text):
+        calls.append(text)
+        return text.upper()
+
+    return score
+
+
+def test_cached_hit_miss_and_version_bump(tmp_path):
+    cache = ScorerCache(str(tmp_path / "scorer_cache.db"))
+    calls = []
+    score = _counting_scorer(cache, "v1", calls)
+
+    assert asyncio.run(score("a")) == "A"
+    assert asyncio.run(score("a")) == "A"
+    assert asyncio.run(score("b")) == "B"
+    assert calls == ["a", "b"]
+
+    # A new version is a new namespace, so entries from v1 are not served
+    bumped = _counting_scorer(cache, "v2", calls)
+    assert asyncio.run(bumped("a")) == "A"
+    assert calls == ["a", "b", "a"]
+
+
+def test_disabled_cache_calls_through():
+    cache = ScorerCache()
+    calls = []
+    score = _counting_scorer(cache, "v1", calls)
+
+    asyncio.run(score("a"))
+    asyncio.run(score("a"))
+
+    assert not cache.enabled
+    assert calls == ["a", "a"]
+    assert cache.get("ns", "a", "default") == "default"
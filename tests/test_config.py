@@ -0,0 +1,76 @@
+"""
+Tests for loading and caching the server configuration.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import config
+from config import InfoFlowConfig, load_config
+
+
+def test_load_config_caches_per_resolved_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "_ENV_CONFIG_PATH", None)
+    load_config.cache_clear()
+
+    assert load_config() is load_config(None)
+
+    (tmp_path / "config.json").write_text(json.dumps({"cpu_workers": 2}))
+    load_config.cache_clear()
+    loaded = load_config()
+
+    assert loaded.cpu_workers == 2
+    assert loaded is load_config(None) is load_config("config.json") is load_config(str(tmp_path / "config.json"))
+    load_config.cache_clear()
+
+
+def test_unchecked_load_trusts_marker_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"cpu_workers": 2, "filter": {"relevance_threshold": 0.4}}))
+    constructed = []
+    monkeypatch.setattr(config, "_construct", lambda cls, data: constructed.append(data) or cls.model_construct())
+
+    first = InfoFlowConfig.from_json_file_unchecked(str(path))
+    assert first.cpu_workers == 2 and first.filter.relevance_threshold == 0.4
+    assert constructed == []
+    assert (tmp_path / "config.json.validated").is_file()
+
+    # Unchanged file: the marker matches, so validation is skipped
+    InfoFlowConfig.from_json_file_unchecked(str(path))
+    assert len(constructed) == 1
+
+    # Changed file: the digest no longer matches, so it is validated again
+    path.write_text(json.dumps({"cpu_workers": "many"}))
+    with pytest.raises(ValidationError):
+        InfoFlowConfig.from_json_file_unchecked(str(path))
+    assert len(constructed) == 1
+
+
+def test_construct_builds_nested_models_without_validation():
+    built = config._construct(InfoFlowConfig, {"cpu_workers": 2, "filter": {"relevance_threshold": 0.4}})
+
+    assert isinstance(built.filter, config.FilterConfig)
+    assert built.filter.relevance_threshold == 0.4
+    assert built.cpu_workers == 2
+
+
+def test_large_config_is_streamed_keeping_only_declared_blocks(tmp_path):
+    pytest.importorskip("ijson")
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({
+        "unrelated_cache": {f"entry{i}": "x" * 64 for i in range(2000)},
+        "cpu_workers": 3,
+        "filter": {"relevance_threshold": 0.25},
+        "notes": ["y" * 64] * 100,
+    }))
+    assert path.stat().st_size > config._JSON_STREAM_THRESHOLD
+
+    raw = config._read_json_config(str(path), InfoFlowConfig.model_fields.keys())
+    assert set(raw) == {"cpu_workers", "filter"}
+
+    loaded = InfoFlowConfig.from_json_file(str(path))
+    assert loaded.cpu_workers == 3
+    assert loaded.filter.relevance_threshold == 0.25
@@ -0,0 +1,65 @@
+"""
+Tests for near-duplicate removal on both signature indexes.
+"""
+
+import pytest
+
+import filters
+from filters import DuplicateDetector
+from models import ContentItem
+
+# Long enough that a couple of edited words leave most word shingles intact
+BASE = " ".join(f"word{i % 97}x{i % 13}" for i in range(300))
+
+
+@pytest.fixture(params=["minhash", "simhash"])
+def detector(request, monkeypatch):
+    if request.param == "minhash":
+        pytest.importorskip("datasketch")
+    monkeypatch.setattr(filters, "DATASKETCH_AVAILABLE", request.param == "minhash")
+    monkeypatch.setattr(filters, "get_encoder", lambda: None)
+    return DuplicateDetector()
+
+
+def test_remove_duplicates_keeps_first_of_each_group(detector):
+    items = [
+        ContentItem(content_id="a", title="Fox story", content=BASE, url="https://a.example"),
+        ContentItem(content_id="b", title="Fox story (updated)", content=BASE + " Updated.", url="https://b.example"),
+        ContentItem(content_id="c", title="FOX STORY", content="Unrelated text about markets."),
+        ContentItem(content_id="d", title="Rates", content="Central banks raised interest rates across europe today."),
+        ContentItem(content_id="e", title="Mirror", content="Different words entirely.", url="https://a.example"),
+    ]
+
+    unique = detector.remove_duplicates_sync(items)
+
+    assert [item.content_id for item in unique] == ["a", "d"]
+
+
+class _FailingEncoder:
+    def encode(self, *args, **kwargs):
+        raise RuntimeError("encoder unavailable")
+
+
+def test_encoder_failure_falls_back_to_signature_similarity(detector, monkeypatch):
+    monkeypatch.setattr(filters, "get_encoder", lambda: _FailingEncoder())
+    items = [
+        ContentItem(content_id="a", title="Fox story", content=BASE),
+        ContentItem(content_id="b", title="Fox story (updated)", content=BASE + " Updated."),
+        ContentItem(content_id="c", title="Rates", content="Central banks raised interest rates across europe today."),
+    ]
+
+    assert [item.content_id for item in detector.remove_duplicates_sync(items)] == ["a", "c"]
+
+
+def test_minhash_collision_below_threshold_is_not_a_match():
+    pytest.importorskip("datasketch")
+    detector = DuplicateDetector()
+    index = filters._MinHashIndex(detector._minhash, detector.similarity_threshold, detector.num_perm)
+    words = BASE.split()
+    kept = ContentItem(content_id="a", title="", content=" ".join(words))
+    # Half of the shingles replaced: well below the 0.85 threshold
+    half = ContentItem(content_id="b", title="", content=" ".join(words[:150] + [f"other{i}" for i in range(150)]))
+    index.insert(0, index.signature(kept))
+
+    assert index.matches(index.signature(kept), [0])
+    assert not index.matches(index.signature(half), [0])
@@ -0,0 +1,129 @@
+"""
+Smoke tests for the filtering pipeline: import the modules and run filter_items end to end.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import filters
+from config import FilterConfig, UserPreferences
+from filters import ContentFilter
+from models import ContentItem, FilterCriteria, FilteredResult
+
+
+class _FakeEncoder:
+    """Deterministic stand-in for the sentence encoder (unit vectors from a text hash)."""
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, normalize_embeddings=False):
+        rows = []
+        for sentence in sentences:
+            rng = np.random.default_rng(abs(hash(sentence)) % (2 ** 32))
+            rows.append(rng.random(8, dtype=np.float32))
+        return np.vstack(rows) if rows else np.empty((0, 8), dtype=np.float32)
+
+
+def _item(index: int, **overrides) -> ContentItem:
+    fields = {
+        "content_id": f"item-{index}",
+        "title": f"Interest rates update number {index}",
+        "content": "Central banks moved interest rates again this week.\n" + "Detail " * 40,
+        "url": f"https://example.com/{index}",
+        "source": "example",
+        "author": "Reporter",
+        "tags": ["economy"],
+        "published_date": datetime.utcnow() - timedelta(days=1),
+    }
+    fields.update(overrides)
+    return ContentItem(**fields)
+
+
+def _reference_quality(item: ContentItem) -> float:
+    """The original per-item quality loop, kept as the oracle for the vectorized version."""
+    quality_score = 0.5
+    content_length = len(item.content)
+    if 200 <= content_length <= 5000:
+        quality_score += 0.2
+    elif content_length > 5000:
+        quality_score += 0.1
+    if item.url and item.url.startswith('http'):
+        quality_score += 0.1
+    if item.author:
+        quality_score += 0.1
+    if item.tags and len(item.tags) > 0:
+        quality_score += 0.1
+    if item.title:
+        if not item.title.isupper():
+            quality_score += 0.05
+        if 10 <= len(item.title) <= 200:
+            quality_score += 0.05
+    if '\n' in item.content:
+        quality_score += 0.1
+    return min(1.0, quality_score)
+
+
+@pytest.fixture
+def content_filter(monkeypatch):
+    # Keep the tests offline: no encoder unless a test installs one
+    monkeypatch.setattr(filters, "get_encoder", lambda: None)
+    return ContentFilter(FilterConfig(), UserPreferences())
+
+
+def test_filter_items_with_server_criteria(content_filter):
+    items = [_item(i) for i in range(5)] + [_item(99, published_date=datetime.utcnow() - timedelta(days=400))]
+    criteria = FilterCriteria(query="interest rates", relevance_threshold=0.1, quality_threshold=0.5, max_age_days=30)
+
+    result = asyncio.run(content_filter.filter_items(items, criteria))
+
+    assert isinstance(result, FilteredResult)
+    assert result.total_processed == len(items)
+    assert "item-99" not in {item.content_id for item in result.filtered_items}
+    scores = [item.relevance_score * item.quality_score for item in result.filtered_items]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_filter_items_default_criteria(content_filter):
+    result = asyncio.run(content_filter.filter_items([_item(i) for i in range(3)]))
+
+    assert result.total_processed == 3
+    assert result.filter_criteria.query == ""
+
+
+def test_filter_items_all_blocked_with_encoder(content_filter, monkeypatch):
+    monkeypatch.setattr(filters, "get_encoder", lambda: _FakeEncoder())
+    criteria = FilterCriteria(query="interest rates", blocked_sources=["example"])
+
+    result = asyncio.run(content_filter.filter_items([_item(i) for i in range(3)], criteria))
+
+    assert result.filtered_items == []
+    assert result.total_filtered == 0
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"content": "short", "url": None, "author": None, "tags": []},
+    {"title": "ALL CAPS HEADLINE", "content": "x" * 6000},
+    {"title": "", "url": "ftp://example.com", "content": "x" * 200},
+])
+def test_quality_matches_reference_loop(content_filter, overrides):
+    item = _item(0, **overrides)
+    expected = _reference_quality(item)
+
+    content_filter._calculate_quality([item])
+
+    assert item.quality_score == expected
+
+
+def test_numba_urgency_kernel_matches_numpy():
+    numba = pytest.importorskip("numba")
+    kernel = numba.njit(filters._urgency_numeric_loop)
+    # NaN (no published date), each bucket boundary and a value either side of it
+    ages_h = np.array([np.nan, -1.0, 0.0, 0.999, 1.0, 23.999, 24.0, 167.999, 168.0, 1e6], dtype=np.float64)
+    relevance = np.linspace(0.0, 1.0, ages_h.size)
+
+    expected = filters._urgency_numeric_numpy(ages_h, relevance)
+
+    np.testing.assert_array_equal(kernel(ages_h, relevance), expected)
+    np.testing.assert_array_equal(filters._urgency_numeric_loop(ages_h, relevance), expected)
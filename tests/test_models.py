@@ -0,0 +1,45 @@
+"""
+Tests for values cached on models from their fields.
+"""
+
+from datetime import datetime
+
+from config import FilterConfig
+from models import ContentItem, FilterCriteria
+
+
+def test_content_item_copy_refreshes_derived_values():
+    item = ContentItem(content_id="1", title="Old title", content="Body", url="https://a.example",
+                       published_date=datetime(2020, 1, 1))
+    old_title_fingerprint = item.title_fingerprint
+    old_url_fingerprint = item.url_fingerprint
+    old_published_ts = item.published_ts
+    item._embedding = "embedding"
+
+    updated = item.model_copy(update={"title": "New title", "published_date": datetime(2025, 1, 1)})
+
+    assert updated.title_fingerprint != old_title_fingerprint
+    assert updated.title_fingerprint == ContentItem(content_id="2", title="New title", content="").title_fingerprint
+    assert updated.published_ts == datetime(2025, 1, 1).timestamp()
+    assert updated._embedding is None
+    # Untouched fields keep their cached values, and the original is unchanged
+    assert updated.url_fingerprint == old_url_fingerprint
+    assert item.title_fingerprint == old_title_fingerprint
+    assert item.published_ts == old_published_ts
+    assert item._embedding == "embedding"
+
+
+def test_content_item_copy_keeps_embedding_for_score_updates():
+    item = ContentItem(content_id="1", title="Title", content="Body")
+    item._embedding = "embedding"
+
+    assert item.model_copy(update={"relevance_score": 0.9})._embedding == "embedding"
+
+
+def test_filter_sets_follow_copied_fields():
+    criteria = FilterCriteria(blocked_sources=["a"])
+    config = FilterConfig(blocked_sources=["a"])
+    assert criteria.blocked_set == config.blocked_set == frozenset({"a"})
+
+    assert criteria.model_copy(update={"blocked_sources": ["b"]}).blocked_set == frozenset({"b"})
+    assert config.model_copy(update={"blocked_sources": ["b"]}).blocked_set == frozenset({"b"})
@@ -0,0 +1,41 @@
+"""
+Round-trip tests for the SQLite storage backend.
+"""
+
+import asyncio
+from datetime import datetime
+
+from config import StorageConfig
+from models import ContentItem
+from storage import SQLiteStorage
+
+
+def test_sqlite_store_get_and_search(tmp_path):
+    storage = SQLiteStorage(StorageConfig(type="sqlite", sqlite_path=str(tmp_path / "infoflow.db")))
+    item = ContentItem(
+        content_id="item-1",
+        title="Rates rise again",
+        content="Central banks raised interest rates.",
+        url="https://example.com/rates",
+        source="wire",
+        author="Reporter",
+        content_type="news",
+        tags=["economy"],
+        relevance_score=0.6,
+        quality_score=0.8,
+        published_date=datetime(2026, 1, 2),
+    )
+
+    async def round_trip():
+        stored = await storage.store_item(item)
+        fetched = await storage.get_item("item-1")
+        found = await storage.search_items("interest", filters={"content_type": "news"})
+        return stored, fetched, found
+
+    stored, fetched, found = asyncio.run(round_trip())
+
+    assert stored
+    fields = ["content_id", "title", "content", "url", "source", "author", "content_type",
+              "tags", "relevance_score", "quality_score", "published_date"]
+    assert {f: getattr(fetched, f) for f in fields} == {f: getattr(item, f) for f in fields}
+    assert [result.content_id for result in found] == ["item-1"]
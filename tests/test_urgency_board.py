@@ -0,0 +1,58 @@
+"""
+Tests for the standing urgency board kept across rank_by_urgency calls.
+"""
+
+import pytest
+
+from filters import UrgencyBoard
+from models import ContentItem
+
+
+def _item(content_id: str) -> ContentItem:
+    return ContentItem(content_id=content_id, title=content_id, content="")
+
+
+def _board_ids(board: UrgencyBoard):
+    return [item.content_id for item, _ in board.top()]
+
+
+def test_tick_decays_old_entries_below_fresh_ones():
+    board = UrgencyBoard(size=5, decay=0.5)
+    board.push(_item("old"), 0.8)
+    board.tick()
+    board.push(_item("fresh"), 0.6)
+
+    assert _board_ids(board) == ["fresh", "old"]
+    assert [score for _, score in board.top()] == pytest.approx([0.6, 0.4])
+
+
+def test_board_evicts_least_urgent_beyond_size():
+    board = UrgencyBoard(size=2)
+    for content_id, score in [("a", 0.5), ("b", 0.9), ("c", 0.7), ("d", 0.1)]:
+        board.push(_item(content_id), score)
+
+    assert len(board) == 2
+    assert _board_ids(board) == ["b", "c"]
+
+
+def test_push_replaces_entry_with_same_content_id():
+    board = UrgencyBoard(size=5)
+    board.push(_item("a"), 0.9)
+    board.push(_item("b"), 0.5)
+    board.push(_item("a"), 0.1)
+
+    assert _board_ids(board) == ["b", "a"]
+    assert board.top()[1][1] == pytest.approx(0.1)
+
+
+def test_scale_is_folded_into_scores_before_underflow():
+    board = UrgencyBoard(size=5, decay=0.2)
+    board.push(_item("a"), 1.0)
+    for _ in range(9):
+        board.tick()
+
+    # 0.2 ** 9 is the first power below _MIN_SCALE, so the ninth tick folds it back to 1
+    assert board._scale == 1.0
+    assert board.top()[0][1] == pytest.approx(0.2 ** 9)
+    board.push(_item("b"), 1e-7)
+    assert _board_ids(board) == ["a", "b"]